@@ -1,9 +1,12 @@
 import os
 import fastf1
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
+from plotly.offline import get_plotlyjs
 from datetime import datetime
 import streamlit as st
+import streamlit.components.v1 as components
 
 # Cache setup
 os.makedirs('cache', exist_ok=True)
@@ -41,27 +44,44 @@ if "session_loaded" not in st.session_state:
     st.session_state.pit_lookup = None
     st.session_state.fastest = None
     st.session_state.available_drivers = []
-    st.session_state.weather_df = None
-
-# helper function used later (kept same behavior)
-def get_pit_info_from_lookup(lookup, abbr, lap):
-    key = (abbr, lap)
-    duration = lookup.get(key)
-    return f"{duration:.2f}s" if duration else None
-
-# ---------------- Extract Data Button ----------------
-if st.button("Extract Data 📊"):
-    try:
-        session = fastf1.get_session(year, track, session_code)
-        session.load()
-
-        # save session obj for weather tab
-        st.session_state.session_obj = session
-
-        # driver info
-        drivers = session.drivers
+    st.session_state.extracted_key = None
+
+# helper: reinterpret the timedelta64 buffer as int64 ns and divide once,
+# instead of total_seconds() allocating with per-element checks (NaT -> NaN).
+# Normalize to ns first: pandas >= 3.0 stores timedelta Series as [us].
+def timedelta_seconds(series):
+    secs = series.to_numpy(dtype='timedelta64[ns]').view('int64') / 1_000_000_000.0
+    secs[series.isna().to_numpy()] = np.nan
+    return secs
+
+# ---------------- Cached session loading ----------------
+@st.cache_resource(show_spinner=False)
+def get_loaded_session(year, track, session_code):
+    # session objects are heavy and not picklable, so they live in the
+    # resource cache (one instance per (year, track, session_code))
+    session = fastf1.get_session(year, track, session_code)
+    session.load()
+    return session
+
+@st.cache_data(show_spinner=False)
+def load_session_frames(year, track, session_code):
+    # All the pandas derivation behind "Extract Data": cached on the same
+    # key so repeat selections skip both the fastf1 load and the reshaping.
+    session = get_loaded_session(year, track, session_code)
+
+    # driver info in one DataFrame pass over session.results; fall back to
+    # the per-driver accessor loop only when results are unavailable
+    results = session.results
+    if results is not None and not results.empty:
+        driver_info = (
+            results[['Abbreviation', 'FullName', 'TeamName', 'DriverNumber']]
+            .rename(columns={'DriverNumber': 'Number'})
+            .set_index('Abbreviation', drop=False)
+            .to_dict('index')
+        )
+    else:
         driver_info = {}
-        for drv in drivers:
+        for drv in session.drivers:
             drv_data = session.get_driver(drv)
             abbr = drv_data['Abbreviation']
             driver_info[abbr] = {
@@ -71,75 +91,262 @@ if st.button("Extract Data 📊"):
                 'Number': drv_data['DriverNumber']
             }
 
-        # Official F1 team colors (kept consistent with your earlier request)
-        team_colors = {
-            'Red Bull Racing': '#3671C6',
-            'Ferrari': '#E8002D',
-            'Mercedes': '#00D2BE',
-            'McLaren': '#FF8000',
-            'Alpine': '#0090FF',
-            'Aston Martin': '#229971',
-            'Alfa Romeo': '#900000',
-            'AlphaTauri': '#2B4562',
-            'Haas F1 Team': '#FFFFFF',
-            'Williams': '#005AFF'
-        }
-
-        # laps & stints
-        laps = session.laps.copy().reset_index()
-        laps['Abbreviation'] = laps['Driver']
-        laps['CompoundChange'] = (laps['Compound'] != laps.groupby('Abbreviation')['Compound'].shift()).astype(int)
-        laps['Stint'] = laps.groupby('Abbreviation')['CompoundChange'].cumsum()
-        laps = laps.dropna(subset=['LapTime'])
-
-        stints = laps.groupby(['Abbreviation', 'Stint', 'Compound']).agg(
-            StartLap=('LapNumber', 'min'),
-            EndLap=('LapNumber', 'max')
-        ).reset_index()
-
-        # pit stops & markers
-        pit_stops = laps.loc[laps['PitOutTime'].notnull()].copy()
-        if not pit_stops.empty:
-            pit_stops['PitDuration'] = (pit_stops['PitOutTime'] - pit_stops['PitInTime']).dt.total_seconds()
-        pit_markers = pit_stops[['Driver', 'LapNumber', 'Compound']].copy()
-        pit_markers['Abbreviation'] = pit_markers['Driver']
-        pit_markers['TyreColor'] = pit_markers['Compound'].map({
+    # Official F1 team colors (kept consistent with your earlier request)
+    team_colors = {
+        'Red Bull Racing': '#3671C6',
+        'Ferrari': '#E8002D',
+        'Mercedes': '#00D2BE',
+        'McLaren': '#FF8000',
+        'Alpine': '#0090FF',
+        'Aston Martin': '#229971',
+        'Alfa Romeo': '#900000',
+        'AlphaTauri': '#2B4562',
+        'Haas F1 Team': '#FFFFFF',
+        'Williams': '#005AFF'
+    }
+
+    # laps & stints
+    # reset_index already returns a new frame, so no up-front copy of the
+    # largest frame in the pipeline
+    laps = session.laps.reset_index()
+    laps['Abbreviation'] = laps['Driver']
+    # Stint IDs in one numpy pass: with laps sorted per driver by lap, a stint
+    # boundary is wherever the driver or compound changes row-to-row. This
+    # avoids the two chained groupby scans (shift + cumsum).
+    laps = laps.sort_values(['Abbreviation', 'LapNumber'], kind='mergesort')
+    drv_arr = laps['Abbreviation'].to_numpy()
+    cmp_arr = laps['Compound'].to_numpy()
+    change = np.ones(len(laps), dtype=bool)
+    change[1:] = (drv_arr[1:] != drv_arr[:-1]) | (cmp_arr[1:] != cmp_arr[:-1])
+    laps['Stint'] = change.cumsum()
+    laps = laps.dropna(subset=['LapTime'])
+
+    # Downcast for plotting: ints/categories shrink the JSON pushed to the
+    # browser, and groupby on categoricals hashes integer codes, not strings
+    laps = laps.astype({
+        'LapNumber': 'int16',
+        'Position': 'Int8',
+        'Abbreviation': 'category',
+        'Compound': 'category',
+        'Driver': 'category'
+    })
+
+    stints = laps.groupby(['Abbreviation', 'Stint', 'Compound'], observed=True).agg(
+        StartLap=('LapNumber', 'min'),
+        EndLap=('LapNumber', 'max')
+    ).reset_index()
+
+    # pit stops & markers (assign returns new frames, so no defensive copies)
+    pit_stops = laps.loc[laps['PitOutTime'].notnull()]
+    if not pit_stops.empty:
+        pit_stops = pit_stops.assign(
+            PitDuration=(pit_stops['PitOutTime'] - pit_stops['PitInTime']).dt.total_seconds())
+    pit_markers = pit_stops[['Driver', 'LapNumber', 'Compound']].assign(
+        Abbreviation=pit_stops['Driver'],
+        TyreColor=pit_stops['Compound'].astype(object).map({
             'Soft': 'red', 'Medium': 'yellow', 'Hard': 'white',
             'Intermediate': 'green', 'Wet': 'blue'
-        }).fillna('gray')
+        }).fillna('gray'))
+
+    # MultiIndex-aligned Series: bulk .reindex() over arrays replaces
+    # per-marker dict lookups
+    if not pit_stops.empty:
+        pit_lookup = pit_stops.set_index(['Driver', 'LapNumber'])['PitDuration']
+    else:
+        pit_lookup = pd.Series(dtype=float)
+
+    # Attach pit durations to stints with a vectorized left-merge instead of
+    # per-stint lookups
+    if not pit_stops.empty:
+        pit_df = pit_stops[['Driver', 'LapNumber', 'PitDuration']].rename(
+            columns={'Driver': 'Abbreviation', 'LapNumber': 'EndLap'})
+        stints = stints.merge(pit_df, on=['Abbreviation', 'EndLap'], how='left')
+    else:
+        stints['PitDuration'] = np.nan
+    stints['PitStop'] = stints['PitDuration'].map(lambda d: f"{d:.2f}s" if pd.notna(d) else None)
+
+    # Columnar driver metadata on the stints frame: one Series.map over plain
+    # dicts here instead of dict-of-dict lookups in the render path
+    team_by_abbr = {a: info['TeamName'] for a, info in driver_info.items()}
+    name_by_abbr = {a: info['FullName'] for a, info in driver_info.items()}
+    abbr_str = stints['Abbreviation'].astype(str)
+    stints = stints.assign(
+        Team=abbr_str.map(team_by_abbr),
+        FullName=abbr_str.map(name_by_abbr)
+    )
+
+    # Single idxmin pass instead of scanning LapTime twice and materializing
+    # a laps-sized boolean mask
+    fastest = laps.loc[[laps['LapTime'].idxmin()]] if not laps.empty else laps
+
+    return {
+        'laps': laps,
+        'driver_info': driver_info,
+        'stints': stints,
+        'pit_markers': pit_markers,
+        'pit_lookup': pit_lookup,
+        'fastest': fastest,
+        'team_colors': team_colors
+    }
+
+@st.cache_resource(show_spinner=False)
+def plotlyjs_bundle():
+    # the plotly.js that ships with the installed plotly.py, so the client
+    # can always decode fig.to_json() output (no CDN version skew, and the
+    # chart keeps working offline)
+    return get_plotlyjs()
+
+@st.cache_data(show_spinner=False)
+def prepare_weather_df(year, track, session_code):
+    # Weather parsing cached on the same key; the session itself comes from
+    # the resource cache, so repeat visits to Tab 5 cost nothing
+    session = get_loaded_session(year, track, session_code)
+    try:
+        if session.weather_data.empty:
+            return None
+        weather_df = session.weather_data.reset_index(drop=True)
+        # convert times if string-like; skip if already datetime
+        if 'Time' in weather_df.columns and not pd.api.types.is_datetime64_any_dtype(weather_df['Time']):
+            try:
+                weather_df['Time'] = pd.to_datetime(weather_df['Time'])
+            except Exception:
+                pass
+        return weather_df
+    except Exception:
+        return None
+
+@st.cache_data(show_spinner=False)
+def build_stint_figure(year, track, session_code, show_pit_stops, show_colored_tyres, show_fastest_lap):
+    # The Tab 1 figure is expensive to assemble, and every widget change in
+    # the other tabs re-runs the script; cache it on the session key plus the
+    # checkboxes that actually affect it. Returns fig.to_json() so the
+    # serialization cost is paid once and cached alongside the figure.
+    frames = load_session_frames(year, track, session_code)
+    stints = frames['stints']
+    pit_markers = frames['pit_markers']
+    pit_lookup = frames['pit_lookup']
+    fastest = frames['fastest']
+    team_colors = frames['team_colors']
+
+    fig = go.Figure()
+    # categories are already the sorted unique drivers, no O(N) set/sort
+    driver_order = list(stints['Abbreviation'].cat.categories)[::-1]
+
+    # Vectorized hover text: map the driver metadata in, then build the
+    # whole column with C-level string concatenation instead of a per-row
+    # Python format loop
+    abbr_str = stints['Abbreviation'].astype(str)
+    hover_col = (
+        "<b>" + stints['FullName'] + " (" + abbr_str + ")</b> | "
+        + stints['Team'] + " | " + stints['Compound'].astype(object).fillna('Unknown').str.title()
+        + "<br>Laps " + stints['StartLap'].astype(str) + "–" + stints['EndLap'].astype(str)
+    )
+    hover_col = hover_col + np.where(
+        stints['PitStop'].notna(), " | Pit: " + stints['PitStop'].fillna(''), '')
+    stints = stints.assign(HoverText=hover_col)
+
+    # One NaN-separated polyline per resolved color instead of one trace
+    # per stint: NaN breaks the line between segments, and grouping by
+    # color (teams on the fallback color share a trace) caps the trace
+    # count at the palette size.
+    if show_colored_tyres:
+        stints = stints.assign(Color=stints['Team'].map(lambda t: team_colors.get(t, '#888888')))
+    else:
+        stints = stints.assign(Color='gray')
+    for color, grp in stints.groupby('Color'):
+        n = len(grp)
+        xs = np.empty(3 * n)
+        xs[0::3] = grp['StartLap']
+        xs[1::3] = grp['EndLap']
+        xs[2::3] = np.nan
+        ys = np.empty(3 * n, dtype=object)
+        ys[0::3] = grp['Abbreviation']
+        ys[1::3] = grp['Abbreviation']
+        ys[2::3] = None
+        hover = np.empty(3 * n, dtype=object)
+        hover[0::3] = grp['HoverText']
+        hover[1::3] = grp['HoverText']
+        fig.add_trace(go.Scattergl(
+            x=xs,
+            y=ys,
+            mode="lines",
+            line=dict(color=color, width=10),
+            hoverinfo="text",
+            hovertext=hover,
+            showlegend=False
+        ))
+
+    if show_pit_stops and not pit_markers.empty:
+        # Single marker trace for every pit stop, colors passed as an array;
+        # durations come from one batched reindex instead of scalar lookups
+        durations = pit_lookup.reindex(pd.MultiIndex.from_arrays(
+            [pit_markers['Abbreviation'], pit_markers['LapNumber']])).to_numpy()
+        dur_text = [f"{d:.2f}s" if pd.notna(d) and d else None for d in durations]
+        pit_hover = [
+            f"Pit Stop | Lap {lap} | {dur}<br>Tyre: {compound}"
+            for lap, compound, dur in zip(
+                pit_markers['LapNumber'], pit_markers['Compound'], dur_text)
+        ]
+        fig.add_trace(go.Scattergl(
+            x=pit_markers['LapNumber'],
+            y=pit_markers['Abbreviation'],
+            mode="markers",
+            marker=dict(color=pit_markers['TyreColor'].tolist(), size=10, symbol='circle'),
+            hovertext=pit_hover,
+            hoverinfo="text",
+            showlegend=False
+        ))
+
+    if show_fastest_lap and not fastest.empty:
+        # Keep SVG Scatter here: scattergl does not render text labels well
+        for _, row in fastest.iterrows():
+            fig.add_trace(go.Scatter(
+                x=[row['LapNumber']],
+                y=[row['Abbreviation']],
+                mode="markers+text",
+                marker=dict(size=16, color='gold', symbol='star'),
+                text=[f"Fastest Lap ({row['Abbreviation']} - {str(row['LapTime']).split('0 days ')[-1]})"],
+                textposition="top center",
+                hoverinfo="text"
+            ))
 
-        pit_lookup = {}
-        if not pit_stops.empty:
-            pit_lookup = pit_stops.set_index(['Driver', 'LapNumber'])['PitDuration'].to_dict()
+    fig.update_layout(
+        xaxis=dict(title="Lap Number", showgrid=True, gridcolor='rgba(255,255,255,0.1)', zeroline=False, color='white'),
+        yaxis=dict(title="Drivers", categoryorder='array', categoryarray=driver_order, color='white'),
+        plot_bgcolor='black',
+        paper_bgcolor='black',
+        font=dict(color='white'),
+        height=850,
+        hovermode="closest",
+        # finite distances stop hover/spike picking from scanning every
+        # point (the Plotly default spikedistance is unbounded)
+        hoverdistance=20,
+        spikedistance=20,
+        margin=dict(t=100, l=150, r=150, b=60)
+    )
+    return fig.to_json()
 
-        fastest = laps.loc[laps['LapTime'] == laps['LapTime'].min()]
+# ---------------- Extract Data Button ----------------
+if st.button("Extract Data 📊"):
+    try:
+        frames = load_session_frames(year, track, session_code)
 
-        # weather (may be empty)
-        weather_df = None
-        try:
-            if not session.weather_data.empty:
-                weather_df = session.weather_data.copy().reset_index(drop=True)
-                # convert times if string-like; else keep as-is
-                if 'Time' in weather_df.columns:
-                    try:
-                        weather_df['Time'] = pd.to_datetime(weather_df['Time'])
-                    except Exception:
-                        pass
-
-        except Exception:
-            weather_df = None
+        # save session obj for weather tab (comes from the resource cache)
+        st.session_state.session_obj = get_loaded_session(year, track, session_code)
 
         # Save everything into session_state (so widget changes won't clear data)
         st.session_state.session_loaded = True
-        st.session_state.laps = laps
-        st.session_state.driver_info = driver_info
-        st.session_state.stints = stints
-        st.session_state.pit_markers = pit_markers
-        st.session_state.pit_lookup = pit_lookup
-        st.session_state.fastest = fastest
-        st.session_state.team_colors = team_colors
-        st.session_state.available_drivers = sorted(laps['Abbreviation'].unique())
-        st.session_state.weather_df = weather_df
+        st.session_state.laps = frames['laps']
+        st.session_state.driver_info = frames['driver_info']
+        st.session_state.stints = frames['stints']
+        st.session_state.pit_markers = frames['pit_markers']
+        st.session_state.pit_lookup = frames['pit_lookup']
+        st.session_state.fastest = frames['fastest']
+        st.session_state.team_colors = frames['team_colors']
+        # categories are already the sorted unique drivers, no O(N) set/sort
+        st.session_state.available_drivers = list(frames['laps']['Abbreviation'].cat.categories)
+        # the key the cached figure/weather builders are memoized on
+        st.session_state.extracted_key = (year, track, session_code)
 
         st.success("Session loaded — scroll down to view tabs.")
     except Exception as e:
@@ -155,7 +362,6 @@ if st.session_state.session_loaded and st.session_state.laps is not None:
     fastest = st.session_state.fastest
     team_colors = st.session_state.team_colors
     available_drivers = st.session_state.available_drivers
-    weather_df = st.session_state.weather_df
     session_obj = st.session_state.session_obj
 
     # Keep your same tabs
@@ -163,70 +369,25 @@ if st.session_state.session_loaded and st.session_state.laps is not None:
 
     # ---------------- Tab 1: Stints & Pit Stops ----------------
     with tab1:
-        fig = go.Figure()
-        driver_order = sorted(stints['Abbreviation'].unique(), reverse=True)
-
-        for _, row in stints.iterrows():
-            abbr = row['Abbreviation']
-            team = driver_info[abbr]['TeamName']
-            color = team_colors.get(team, '#888888') if show_colored_tyres else 'gray'
-            tyre = row['Compound'].title() if row['Compound'] else "Unknown"
-            name = driver_info[abbr]['FullName']
-            hovertext = (
-                f"<b>{name} ({abbr})</b> | {team} | {tyre}<br>"
-                f"Laps {row['StartLap']}–{row['EndLap']}"
-                + (f" | Pit: {get_pit_info_from_lookup(pit_lookup, row['Abbreviation'], row['EndLap'])}" if get_pit_info_from_lookup(pit_lookup, row['Abbreviation'], row['EndLap']) else '')
+        # Rebuilt only when the session or one of its checkboxes changes;
+        # unrelated widget reruns hit the figure cache. The cached JSON is
+        # handed straight to Plotly.react, which reuses existing DOM/WebGL
+        # state on updates instead of replotting from scratch, and skips
+        # st.plotly_chart's per-rerun re-serialization.
+        if st.session_state.extracted_key is not None:
+            extracted_year, extracted_track, extracted_code = st.session_state.extracted_key
+            fig_json = build_stint_figure(
+                extracted_year, extracted_track, extracted_code,
+                show_pit_stops, show_colored_tyres, show_fastest_lap)
+            components.html(
+                "<script>" + plotlyjs_bundle() + "</script>"
+                "<div id='stint-chart'></div>"
+                "<script>"
+                f"var fig = {fig_json};"
+                "Plotly.react('stint-chart', fig.data, fig.layout, {responsive: true});"
+                "</script>",
+                height=900
             )
-            fig.add_trace(go.Scatter(
-                x=[row['StartLap'], row['EndLap']],
-                y=[abbr, abbr],
-                mode="lines",
-                line=dict(color=color, width=10),
-                hoverinfo="text",
-                hovertext=hovertext,
-                showlegend=False
-            ))
-
-        if show_pit_stops and not pit_markers.empty:
-            for _, row in pit_markers.iterrows():
-                abbr = row['Abbreviation']
-                lap = row['LapNumber']
-                compound = row['Compound']
-                color = row['TyreColor']
-                duration = get_pit_info_from_lookup(pit_lookup, abbr, lap)
-                fig.add_trace(go.Scatter(
-                    x=[lap],
-                    y=[abbr],
-                    mode="markers",
-                    marker=dict(color=color, size=10, symbol='circle'),
-                    hovertext=f"Pit Stop | Lap {lap} | {duration}<br>Tyre: {compound}",
-                    hoverinfo="text",
-                    showlegend=False
-                ))
-
-        if show_fastest_lap and not fastest.empty:
-            for _, row in fastest.iterrows():
-                fig.add_trace(go.Scatter(
-                    x=[row['LapNumber']],
-                    y=[row['Abbreviation']],
-                    mode="markers+text",
-                    marker=dict(size=16, color='gold', symbol='star'),
-                    text=[f"Fastest Lap ({row['Abbreviation']} - {str(row['LapTime']).split('0 days ')[-1]})"],
-                    textposition="top center",
-                    hoverinfo="text"
-                ))
-
-        fig.update_layout(
-            xaxis=dict(title="Lap Number", showgrid=True, gridcolor='rgba(255,255,255,0.1)', zeroline=False, color='white'),
-            yaxis=dict(title="Drivers", categoryorder='array', categoryarray=driver_order, color='white'),
-            plot_bgcolor='black',
-            paper_bgcolor='black',
-            font=dict(color='white'),
-            height=850,
-            hovermode="closest",
-            margin=dict(t=100, l=150, r=150, b=60)
-        )
-        st.plotly_chart(fig, use_container_width=True)
 
         # ---------------- Tab 2: Sector Times ---------------- #
         with tab2:
@@ -236,7 +397,7 @@ if st.session_state.session_loaded and st.session_state.laps is not None:
                 Sector3=('Sector3Time', 'min')
             ).reset_index()
             for col in ['Sector1', 'Sector2', 'Sector3']:
-                sector_best[col] = sector_best[col].dt.total_seconds()
+                sector_best[col] = timedelta_seconds(sector_best[col])
 
             fig_sector = go.Figure()
             for sector in ['Sector1', 'Sector2', 'Sector3']:
@@ -245,8 +406,8 @@ if st.session_state.session_loaded and st.session_state.laps is not None:
                     y=sector_best[sector],
                     name=sector
                 ))
-            fig_sector.update_layout(barmode='group', title="Best Sector Times (seconds)", plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'))
-            st.plotly_chart(fig_sector, use_container_width=True)
+            fig_sector.update_layout(barmode='group', title="Best Sector Times (seconds)", plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'), hoverdistance=20, spikedistance=20)
+            st.plotly_chart(fig_sector, use_container_width=True, config={'responsive': True})
 
 
     # ---------------- Tab 3: Lap Delta ----------------
@@ -270,17 +431,17 @@ if st.session_state.session_loaded and st.session_state.laps is not None:
             # merge on LapNumber — handle missing laps gracefully
             merged = pd.merge(laps_a[['LapNumber', 'LapTime']], laps_b[['LapNumber', 'LapTime']], on='LapNumber', suffixes=('_A', '_B'))
             if not merged.empty:
-                merged['Delta'] = (merged['LapTime_A'] - merged['LapTime_B']).dt.total_seconds()
+                merged['Delta'] = timedelta_seconds(merged['LapTime_A'] - merged['LapTime_B'])
 
                 fig_delta = go.Figure()
                 # color lines by team (driver B color used for positive/negative interpretation)
                 color_a = team_colors.get(driver_info[driver_a]['TeamName'], '#888888')
                 color_b = team_colors.get(driver_info[driver_b]['TeamName'], '#888888')
 
-                fig_delta.add_trace(go.Scatter(x=merged['LapNumber'], y=merged['Delta'], mode='lines+markers',
+                fig_delta.add_trace(go.Scattergl(x=merged['LapNumber'], y=merged['Delta'], mode='lines+markers',
                                               marker=dict(color=color_b), line=dict(color=color_b)))
-                fig_delta.update_layout(title=f"Lap Time Delta: {driver_a} vs {driver_b} (Positive = {driver_b} faster)", plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'))
-                st.plotly_chart(fig_delta, use_container_width=True)
+                fig_delta.update_layout(title=f"Lap Time Delta: {driver_a} vs {driver_b} (Positive = {driver_b} faster)", plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'), hoverdistance=20, spikedistance=20)
+                st.plotly_chart(fig_delta, use_container_width=True, config={'responsive': True})
             else:
                 st.warning("No overlapping lap numbers between selected drivers to compute delta.")
         else:
@@ -288,23 +449,45 @@ if st.session_state.session_loaded and st.session_state.laps is not None:
 
     # ---------------- Tab 4: Position Changes ----------------
     with tab4:
-        pos_data = laps.groupby(['LapNumber', 'Abbreviation'])['Position'].mean().reset_index()
+        # Position is already one value per (driver, lap), so pivot directly
+        # instead of paying for a redundant groupby-mean
+        pos_data = laps[['LapNumber', 'Abbreviation', 'Position']].dropna(subset=['Position'])
+        pos_pivot = pos_data.pivot(index='LapNumber', columns='Abbreviation', values='Position')
+
+        # Join each team's driver series into one NaN-separated polyline, so
+        # the chart is at most ten traces instead of one per driver
+        drivers_by_team = {}
+        for drv in pos_pivot.columns:
+            drivers_by_team.setdefault(driver_info[drv]['TeamName'], []).append(drv)
+
         fig_pos = go.Figure()
-        for drv in sorted(set(laps['Abbreviation'])):
-            d = pos_data[pos_data['Abbreviation'] == drv]
-            fig_pos.add_trace(go.Scatter(
-                x=d['LapNumber'],
-                y=d['Position'],
+        for team, team_drivers in drivers_by_team.items():
+            xs, ys = [], []
+            for drv in team_drivers:
+                series = pos_pivot[drv].dropna()
+                xs.extend([series.index.to_numpy(), [np.nan]])
+                ys.extend([series.to_numpy(dtype=float), [np.nan]])
+            fig_pos.add_trace(go.Scattergl(
+                x=np.concatenate(xs),
+                y=np.concatenate(ys),
                 mode='lines',
-                name=drv,
-                line=dict(color=team_colors.get(driver_info[drv]['TeamName'], '#888888'))
+                name=team,
+                legendgroup=team,
+                connectgaps=False,
+                line=dict(color=team_colors.get(team, '#888888'))
             ))
         fig_pos.update_yaxes(autorange='reversed')  # P1 at top
-        fig_pos.update_layout(title="Position Changes Over Race", plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'))
-        st.plotly_chart(fig_pos, use_container_width=True)
+        fig_pos.update_layout(title="Position Changes Over Race", plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'), hoverdistance=20, spikedistance=20)
+        st.plotly_chart(fig_pos, use_container_width=True, config={'responsive': True})
 
     # ---------------- Tab 5: Weather & Track Data ----------------
     with tab5:
+        # Weather parsing is deferred until this tab is reached, then served
+        # from the data cache on every later rerun
+        weather_df = None
+        if st.session_state.extracted_key is not None:
+            weather_df = prepare_weather_df(*st.session_state.extracted_key)
+
         if weather_df is not None and not weather_df.empty:
             # show some summary values (use first row as "start" values if present)
             first_row = weather_df.iloc[0]
@@ -333,16 +516,16 @@ if st.session_state.session_loaded and st.session_state.laps is not None:
             x = weather_df['Time'] if 'Time' in weather_df.columns else weather_df.index
 
             if 'AirTemp' in weather_df.columns:
-                fig_weather.add_trace(go.Scatter(x=x, y=weather_df['AirTemp'], mode='lines', name='Air Temp (°C)'))
+                fig_weather.add_trace(go.Scattergl(x=x, y=weather_df['AirTemp'], mode='lines', name='Air Temp (°C)'))
             if 'TrackTemp' in weather_df.columns:
-                fig_weather.add_trace(go.Scatter(x=x, y=weather_df['TrackTemp'], mode='lines', name='Track Temp (°C)'))
+                fig_weather.add_trace(go.Scattergl(x=x, y=weather_df['TrackTemp'], mode='lines', name='Track Temp (°C)'))
             if 'Humidity' in weather_df.columns:
-                fig_weather.add_trace(go.Scatter(x=x, y=weather_df['Humidity'], mode='lines', name='Humidity (%)'))
+                fig_weather.add_trace(go.Scattergl(x=x, y=weather_df['Humidity'], mode='lines', name='Humidity (%)'))
             if 'WindSpeed' in weather_df.columns:
-                fig_weather.add_trace(go.Scatter(x=x, y=weather_df['WindSpeed'], mode='lines', name='Wind Speed'))
+                fig_weather.add_trace(go.Scattergl(x=x, y=weather_df['WindSpeed'], mode='lines', name='Wind Speed'))
 
-            fig_weather.update_layout(title="Weather & Track Conditions Over Session", plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'), hovermode='x unified')
-            st.plotly_chart(fig_weather, use_container_width=True)
+            fig_weather.update_layout(title="Weather & Track Conditions Over Session", plot_bgcolor='black', paper_bgcolor='black', font=dict(color='white'), hovermode='x unified', hoverdistance=20, spikedistance=20)
+            st.plotly_chart(fig_weather, use_container_width=True, config={'responsive': True})
 
             # show count of weather descriptions if present
             if 'Weather' in weather_df.columns:
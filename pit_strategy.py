@@ -1,5 +1,6 @@
 import os
 import fastf1
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
 from datetime import datetime
@@ -35,54 +36,74 @@ team_colors = {
 # =========================
 # Driver info
 # =========================
-drivers = session.drivers
-driver_info = {}
-for drv in drivers:
-    drv_data = session.get_driver(drv)
-    abbr = drv_data['Abbreviation']
-    driver_info[abbr] = {
-        'Abbreviation': abbr,
-        'FullName': drv_data['FullName'],
-        'TeamName': drv_data['TeamName'],
-        'Number': drv_data['DriverNumber']
-    }
+# One DataFrame pass over session.results; fall back to the per-driver
+# accessor loop only when results are unavailable
+_results = session.results
+if _results is not None and not _results.empty:
+    driver_info = (
+        _results[['Abbreviation', 'FullName', 'TeamName', 'DriverNumber']]
+        .rename(columns={'DriverNumber': 'Number'})
+        .set_index('Abbreviation', drop=False)
+        .to_dict('index')
+    )
+else:
+    driver_info = {}
+    for drv in session.drivers:
+        drv_data = session.get_driver(drv)
+        abbr = drv_data['Abbreviation']
+        driver_info[abbr] = {
+            'Abbreviation': abbr,
+            'FullName': drv_data['FullName'],
+            'TeamName': drv_data['TeamName'],
+            'Number': drv_data['DriverNumber']
+        }
 
 # =========================
 # Stints and Pit Stops
 # =========================
-laps = session.laps.copy().reset_index()
+# reset_index already returns a new frame, so no up-front copy of the
+# largest frame in the pipeline
+laps = session.laps.reset_index()
 laps['Abbreviation'] = laps['Driver']
-laps['CompoundChange'] = (laps['Compound'] != laps.groupby('Abbreviation')['Compound'].shift()).astype(int)
-laps['Stint'] = laps.groupby('Abbreviation')['CompoundChange'].cumsum()
+# Stint IDs in one numpy pass: with laps sorted per driver by lap, a stint
+# boundary is wherever the driver or compound changes row-to-row. This
+# avoids the two chained groupby scans (shift + cumsum).
+laps = laps.sort_values(['Abbreviation', 'LapNumber'], kind='mergesort')
+drv_arr = laps['Abbreviation'].to_numpy()
+cmp_arr = laps['Compound'].to_numpy()
+change = np.ones(len(laps), dtype=bool)
+change[1:] = (drv_arr[1:] != drv_arr[:-1]) | (cmp_arr[1:] != cmp_arr[:-1])
+laps['Stint'] = change.cumsum()
 
 stints = laps.groupby(['Abbreviation', 'Stint', 'Compound']).agg(
     StartLap=('LapNumber', 'min'),
     EndLap=('LapNumber', 'max')
 ).reset_index()
 
-pit_stops = session.laps.loc[session.laps['PitOutTime'].notnull()].copy()
-pit_stops['PitDuration'] = (pit_stops['PitOutTime'] - pit_stops['PitInTime']).dt.total_seconds()
+# assign returns new frames, so no defensive copies of the pit slices
+pit_stops = session.laps.loc[session.laps['PitOutTime'].notnull()].assign(
+    PitDuration=lambda df: (df['PitOutTime'] - df['PitInTime']).dt.total_seconds())
 
 # Create a pit marker dataframe for visualization
-pit_markers = pit_stops[['Driver', 'LapNumber', 'Compound']].copy()
-pit_markers['Abbreviation'] = pit_markers['Driver']
-pit_markers['TyreColor'] = pit_markers['Compound'].map({
-    'Soft': 'red',
-    'Medium': 'yellow',
-    'Hard': 'white',
-    'Intermediate': 'green',
-    'Wet': 'blue'
-}).fillna('gray')
-
-# Create a quick lookup dictionary for pit stop durations
-pit_lookup = pit_stops.set_index(['Driver', 'LapNumber'])['PitDuration'].to_dict()
+pit_markers = pit_stops[['Driver', 'LapNumber', 'Compound']].assign(
+    Abbreviation=pit_stops['Driver'],
+    TyreColor=pit_stops['Compound'].map({
+        'Soft': 'red',
+        'Medium': 'yellow',
+        'Hard': 'white',
+        'Intermediate': 'green',
+        'Wet': 'blue'
+    }).fillna('gray'))
 
-def get_pit_info(abbr, lap):
-    key = (abbr, lap)
-    duration = pit_lookup.get(key)
-    return f"{duration:.2f}s" if duration else None
+# Pit stop durations as a MultiIndex-aligned Series: bulk .reindex() over
+# arrays replaces per-marker dict lookups
+pit_lookup = pit_stops.set_index(['Driver', 'LapNumber'])['PitDuration']
 
-stints['PitStop'] = stints.apply(lambda x: get_pit_info(x['Abbreviation'], x['EndLap']), axis=1)
+# Attach pit durations with a vectorized left-merge instead of a row-wise apply
+pit_df = pit_stops[['Driver', 'LapNumber', 'PitDuration']].rename(
+    columns={'Driver': 'Abbreviation', 'LapNumber': 'EndLap'})
+stints = stints.merge(pit_df, on=['Abbreviation', 'EndLap'], how='left')
+stints['PitStop'] = stints['PitDuration'].map(lambda d: f"{d:.2f}s" if pd.notna(d) else None)
 
 # =========================
 # Chart creation
@@ -90,42 +111,66 @@ stints['PitStop'] = stints.apply(lambda x: get_pit_info(x['Abbreviation'], x['En
 fig = go.Figure()
 driver_order = sorted(stints['Abbreviation'].unique(), reverse=True)
 
-for _, row in stints.iterrows():
-    abbr = row['Abbreviation']
-    team = driver_info[abbr]['TeamName']
-    color = team_colors.get(team, '#888888')
-    tyre = row['Compound'].title() if row['Compound'] else "Unknown"
-    hovertext = (
-        f"<b>{abbr}</b> | {team} | {tyre}<br>"
-        f"Laps {row['StartLap']}–{row['EndLap']}"
-        + (f" | Pit: {row['PitStop']}" if row['PitStop'] else '')
-    )
-    fig.add_trace(go.Scatter(
-        x=[row['StartLap'], row['EndLap']],
-        y=[abbr, abbr],
+# Vectorized hover text: map the team in, then build the whole column with
+# C-level string concatenation instead of a per-row Python format loop
+team_by_abbr = {a: info['TeamName'] for a, info in driver_info.items()}
+stints = stints.assign(Team=stints['Abbreviation'].map(team_by_abbr))
+hover_col = (
+    "<b>" + stints['Abbreviation'] + "</b> | " + stints['Team'] + " | "
+    + stints['Compound'].fillna('Unknown').str.title()
+    + "<br>Laps " + stints['StartLap'].astype(str) + "–" + stints['EndLap'].astype(str)
+)
+hover_col = hover_col + np.where(
+    stints['PitStop'].notna(), " | Pit: " + stints['PitStop'].fillna(''), '')
+stints = stints.assign(HoverText=hover_col)
+
+# One NaN-separated polyline per resolved color instead of one trace per
+# stint: NaN breaks the line between segments, and grouping by color (teams
+# on the fallback color share a trace) caps the trace count at the palette
+# size.
+stints = stints.assign(Color=stints['Team'].map(lambda t: team_colors.get(t, '#888888')))
+for color, grp in stints.groupby('Color'):
+    n = len(grp)
+    xs = np.empty(3 * n)
+    xs[0::3] = grp['StartLap']
+    xs[1::3] = grp['EndLap']
+    xs[2::3] = np.nan
+    ys = np.empty(3 * n, dtype=object)
+    ys[0::3] = grp['Abbreviation']
+    ys[1::3] = grp['Abbreviation']
+    ys[2::3] = None
+    hover = np.empty(3 * n, dtype=object)
+    hover[0::3] = grp['HoverText']
+    hover[1::3] = grp['HoverText']
+    fig.add_trace(go.Scattergl(
+        x=xs,
+        y=ys,
         mode="lines",
         line=dict(color=color, width=10),
         hoverinfo="text",
-        hovertext=hovertext,
+        hovertext=hover,
         showlegend=False
     ))
 
-# Add pit stop markers
-for _, row in pit_markers.iterrows():
-    abbr = row['Abbreviation']
-    lap = row['LapNumber']
-    compound = row['Compound']
-    color = row['TyreColor']
-    duration = get_pit_info(abbr, lap)
-    fig.add_trace(go.Scatter(
-        x=[lap],
-        y=[abbr],
-        mode="markers",
-        marker=dict(color=color, size=10, symbol='circle'),
-        hovertext=f"Pit Stop | Lap {lap} | {duration}<br>Tyre: {compound}",
-        hoverinfo="text",
-        showlegend=False
-    ))
+# Add all pit stop markers as a single trace, colors passed as an array;
+# durations come from one batched reindex instead of scalar lookups
+durations = pit_lookup.reindex(pd.MultiIndex.from_arrays(
+    [pit_markers['Abbreviation'], pit_markers['LapNumber']])).to_numpy()
+dur_text = [f"{d:.2f}s" if pd.notna(d) and d else None for d in durations]
+pit_hover = [
+    f"Pit Stop | Lap {lap} | {dur}<br>Tyre: {compound}"
+    for lap, compound, dur in zip(
+        pit_markers['LapNumber'], pit_markers['Compound'], dur_text)
+]
+fig.add_trace(go.Scattergl(
+    x=pit_markers['LapNumber'],
+    y=pit_markers['Abbreviation'],
+    mode="markers",
+    marker=dict(color=pit_markers['TyreColor'].tolist(), size=10, symbol='circle'),
+    hovertext=pit_hover,
+    hoverinfo="text",
+    showlegend=False
+))
 
 # =========================
 # Fastest lap
@@ -147,7 +192,10 @@ fig.add_vline(
 # Safety car
 # =========================
 sc_msgs = session.race_control_messages
-sc_laps = sorted(sc_msgs[sc_msgs['Message'].str.contains("SAFETY CAR", case=False, na=False)]['Lap'].dropna().unique())
+# One vectorized upper() plus a plain substring scan (regex=False) beats
+# running the regex engine with case-folding on every message
+sc_mask = sc_msgs['Message'].str.upper().str.contains("SAFETY CAR", regex=False, na=False)
+sc_laps = sorted(sc_msgs.loc[sc_mask, 'Lap'].dropna().unique())
 
 for lap in sc_laps:
     fig.add_vrect(
@@ -174,7 +222,10 @@ weather_text = (
 race_name = f"Formula 1 - {session.event['EventName']} {session.event.year}"
 race_date = datetime.fromisoformat(str(session.event['EventDate'])).strftime("%d %B %Y")
 
-fig.add_annotation(
+# Annotations are collected as plain dicts and applied in one batch inside
+# the final update_layout, so the figure validator runs once instead of once
+# per add_annotation call
+header_ann = dict(
     xref="paper", yref="paper",
     x=0.5, y=1.15,
     text=f"<b style='font-size:20px'>{race_name}</b><br><span style='color:yellow'>{race_date} — {weather_text}</span>",
@@ -187,12 +238,29 @@ fig.add_annotation(
 # Starting Grid
 # =========================
 results = session.results
-starting_grid = results.sort_values('GridPosition')
-grid_text = "<b>Starting Grid</b><br>" + "<br>".join(
-    f"{int(row['GridPosition'])}. {driver_info[row['Abbreviation']]['FullName']} ({row['Abbreviation']})"
-    for _, row in starting_grid.iterrows()
+# One "Full Name (ABB)" label per driver, formatted once and reused by both
+# annotation blocks below
+label_by_abbr = {a: f"{info['FullName']} ({a})" for a, info in driver_info.items()}
+
+# Pull the needed columns once as numpy arrays and order them with argsort /
+# argpartition, instead of copying and re-indexing the whole results frame
+# with sort_values and nsmallest just to read three columns
+res_abbr = results['Abbreviation'].to_numpy()
+res_grid = results['GridPosition'].to_numpy()
+res_pos = results['Position'].to_numpy()
+
+grid_order = np.argsort(res_grid, kind='stable')
+grid_abbr = res_abbr[grid_order]
+grid_pos = res_grid[grid_order].astype(int)
+# one join over a prebuilt list (header included), no generator protocol
+# and no extra concatenation afterwards
+grid_lines = ["<b>Starting Grid</b>"]
+grid_lines.extend(
+    f"{p}. {label_by_abbr[a]}"
+    for p, a in zip(grid_pos.tolist(), grid_abbr.tolist())
 )
-fig.add_annotation(
+grid_text = "<br>".join(grid_lines)
+grid_ann = dict(
     xref="paper", yref="paper",
     x=-0.9, y=1.09,
     text=grid_text,
@@ -207,12 +275,21 @@ fig.add_annotation(
 # =========================
 # Podium
 # =========================
-podium = results.nsmallest(3, 'Position')
-podium_text = "<b>Podium</b><br>" + "<br>".join(
-    f"{int(row['Position'])}. {driver_info[row['Abbreviation']]['FullName']} ({row['Abbreviation']})"
-    for _, row in podium.iterrows()
+# top-3 by finishing position: partial partition, then sort only those three
+if len(res_pos) > 3:
+    top3 = np.argpartition(res_pos, 3)[:3]
+else:
+    top3 = np.arange(len(res_pos))
+top3 = top3[np.argsort(res_pos[top3])]
+podium_abbr = res_abbr[top3]
+podium_pos = res_pos[top3].astype(int)
+podium_lines = ["<b>Podium</b>"]
+podium_lines.extend(
+    f"{p}. {label_by_abbr[a]}"
+    for p, a in zip(podium_pos.tolist(), podium_abbr.tolist())
 )
-fig.add_annotation(
+podium_text = "<br>".join(podium_lines)
+podium_ann = dict(
     xref="paper", yref="paper",
     x=1.0, y=1.09,
     text=podium_text,
@@ -227,16 +304,28 @@ fig.add_annotation(
 # =========================
 # Layout styling
 # =========================
-fig.update_layout(
-    xaxis=dict(title="Lap Number", showgrid=True, gridcolor='rgba(255,255,255,0.1)', zeroline=False, color='white'),
-    yaxis=dict(title="Drivers", categoryorder='array', categoryarray=driver_order, color='white'),
-    plot_bgcolor='black',
-    paper_bgcolor='black',
-    font=dict(color='white'),
-    margin=dict(t=200, l=200, r=200, b=60),
-    height=950,
-    hovermode="closest",
-    title=dict(text="", x=0.5)
-)
+# Assemble the whole layout as one plain dict and hand it to update_layout
+# in a single call, so validate/coerce runs once over the finished tree
+# instead of per keyword mutation
+layout_dict = {
+    "xaxis": {"title": "Lap Number", "showgrid": True, "gridcolor": 'rgba(255,255,255,0.1)', "zeroline": False, "color": 'white'},
+    "yaxis": {"title": "Drivers", "categoryorder": 'array', "categoryarray": driver_order, "color": 'white'},
+    "plot_bgcolor": 'black',
+    "paper_bgcolor": 'black',
+    "font": {"color": 'white'},
+    "margin": {"t": 200, "l": 200, "r": 200, "b": 60},
+    "height": 950,
+    "hovermode": "closest",
+    # finite distances stop hover/spike picking from scanning every point
+    # (the Plotly default spikedistance is unbounded)
+    "hoverdistance": 20,
+    "spikedistance": 20,
+    "title": {"text": "", "x": 0.5},
+    # append to the annotations the fastest-lap vline already placed:
+    # update_layout merges a bare list into the existing tuple element-wise,
+    # which would silently drop the header
+    "annotations": list(fig.layout.annotations) + [header_ann, grid_ann, podium_ann]
+}
+fig.update_layout(layout_dict)
 
 fig.show()